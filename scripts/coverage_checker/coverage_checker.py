@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import argparse
+import re
 import sys
 from enum import Flag, StrEnum, auto
 from typing import IO, Iterator, Optional  # noqa: UP035 Iterator from typing is expected here
@@ -68,11 +69,18 @@ class InputLine:
         line : str
             The input line to process.
         """
-        line_parts = line.split("|")
+        # Data ends at the first separator, comment starts after the last one.
+        data_end = line.find("|")
+        if data_end == -1:
+            self.data = line.rstrip()
+            self.comment = None
+            self.space_count = None
+            return
 
-        self.data = line_parts[0].rstrip()
-        self.comment = line_parts[-1].lstrip() if len(line_parts) > 1 else None
-        self.space_count = (len(line_parts[0]) - len(self.data)) if self.comment else None
+        data_part = line[:data_end]
+        self.data = data_part.rstrip()
+        self.comment = line[line.rfind("|") + 1 :].lstrip()
+        self.space_count = (len(data_part) - len(self.data)) if self.comment else None
 
     def has_comment(self) -> bool:
         """
@@ -111,9 +119,11 @@ class Entry:
         """
         self.line = InputLine(line)
         self.item_type = item_type
-        self.name = self._find_name(self.line.data)
+        # Data line is split once and shared by name and visibility lookups.
+        tokens = self.line.data.split()
+        self.name = self._find_name(tokens)
         self.nest_level = self._compute_nest_level(find_index)
-        self.visibility = self._find_visibility(self.line.data)
+        self.visibility = self._find_visibility(tokens)
 
     def _compute_nest_level(self, find_index: int) -> int:
         """
@@ -127,45 +137,45 @@ class Entry:
         indent_size = 4
         return (find_index + 2) // indent_size  # +2 as we match with "─ " at the start
 
-    def _find_visibility(self, data_line: str) -> Visibility:
+    def _find_visibility(self, tokens: list[str]) -> Visibility:
         """
         Find the visibility of the item in the data line.
 
         Parameters
         ----------
-        data_line : str
-            The line of data to check for visibility.
+        tokens : list[str]
+            Whitespace-separated tokens of the data line.
         """
-        tokens = data_line.split()
-
         if tokens[0] == "crate":
             # Crate has no visibility specifier, set pub for convenience
             return Visibility.PUB
 
-        tokens.reverse()
-        for token in tokens:
-            token = token.strip()
+        # Visibility follows the name and might be followed by attributes - search from the end.
+        for token in reversed(tokens):
             if token.startswith("pub"):
                 return Visibility(token)
 
-        raise RuntimeError(f"Visibility not detected for: {data_line}")
+        raise RuntimeError(f"Visibility not detected for: {self.line.data}")
 
-    def _find_name(self, data_line: str) -> str:
+    def _find_name(self, tokens: list[str]) -> str:
         """
         Find the name of the item in the data line.
-        """
-        tokens = data_line.split()
 
+        Parameters
+        ----------
+        tokens : list[str]
+            Whitespace-separated tokens of the data line.
+        """
         if tokens[0] == "crate":  # Crate name does not end with colon
             return f"{tokens[0]}_{tokens[1]}"  # crate <module_name>
 
-        tokens.reverse()
-        for ndx, token in enumerate(tokens):
-            token = token.strip()
+        # Name ends with colon and is preceded by item type - search from the end.
+        for ndx in range(len(tokens) - 1, 0, -1):
+            token = tokens[ndx]
             if token.endswith(":"):
-                return f"{tokens[ndx + 1]}_{token[:-1]}"
+                return f"{tokens[ndx - 1]}_{token[:-1]}"
 
-        raise RuntimeError("Name not detected for: {data_line}")
+        raise RuntimeError(f"Name not detected for: {self.line.data}")
 
     def __str__(self) -> str:
         return (
@@ -174,123 +184,71 @@ class Entry:
         )
 
 
-class Indexer:
-    """
-    Simple indexer to iterate through a range of indices.
-    """
-
-    def __init__(self, ndx_count: int):
-        """
-        Initialize Indexer with the count of indices.
-
-        Parameters
-        ----------
-        ndx_count : int
-            The total number of indices to iterate through.
-        """
-        self.value = None
-        self.ndx_count = ndx_count
-
-    def _raise_if_invalid_range(self, new_val: int) -> None:
-        """
-        Raise IndexError if the new value is out of range.
-
-        Parameters
-        ----------
-        new_val : int
-            The new index value to check.
-        """
-        if new_val >= self.ndx_count:
-            raise IndexError("Indexer out of range")
-
-    def next(self) -> int:
-        """
-        Get the next index and increment the indexer.
-        Raises IndexError if the indexer is out of range.
-        """
-        if self.value is None:
-            self.value = 0
-        else:
-            new_value = self.value + 1
-            self._raise_if_invalid_range(new_value)
-            self.value = new_value
-
-        return self.value
-
-    def next_no_inc(self) -> int:
-        """
-        Get the next index without incrementing the indexer.
-        Raises IndexError if the indexer is not started.
-        """
-        if self.value is None:
-            raise RuntimeError("Indexer not started")
-
-        new_value = self.value + 1
-        self._raise_if_invalid_range(new_value)
-        return new_value
-
-
 class TreeNode:
     """
     Represents a node in the tree structure of crate items.
     Each node can have children and contains metadata about the item.
     """
 
-    def __init__(self, entries: list[Entry], ndx: Indexer, parent: Optional["TreeNode"] = None):
+    __slots__ = (
+        "line",
+        "name",
+        "unique_name",
+        "item_type",
+        "visibility",
+        "parent",
+        "children",
+        "has_matching_type",
+    )
+
+    def __init__(self, entry: Entry, parent: Optional["TreeNode"] = None):
         """
-        Initialize TreeNode with entries, indexer, and optional parent node.
+        Initialize TreeNode from entry and optional parent node.
+        Children are added by the tree during construction.
 
         Parameters
         ----------
-        entries : list[Entry]
-            List of Entry objects representing the crate structure.
-        ndx : Indexer
-            Indexer to track the current position in the entries.
+        entry : Entry
+            Entry representing the crate item.
         parent : TreeNode | None
             Parent node in the tree structure, if any.
         """
-        self.metadata = set()
-        try:
-            entry = entries[ndx.next()]
-
-            self.line = entry.line
-            self.name = entry.name
-            self.unique_name = f"{parent.unique_name}::{self.name}" if parent is not None else self.name
-            self.item_type = entry.item_type
-            self.visibility = entry.visibility
-            self.parent = parent
-            self.children = []
-
-            nest_level = entry.nest_level
-
-            while True:
-                next_entry = entries[ndx.next_no_inc()]
-
-                if next_entry.nest_level > nest_level:
-                    self.children.append(TreeNode(entries, ndx, self))
-                else:
-                    return
-
-        except IndexError:
-            return
+        self.line = entry.line
+        self.name = entry.name
+        self.unique_name = f"{parent.unique_name}::{self.name}" if parent is not None else self.name
+        self.item_type = entry.item_type
+        self.visibility = entry.visibility
+        self.parent = parent
+        self.children = []
+        self.has_matching_type = False
 
     def traverse_depth_first_pre_order(self) -> Iterator["TreeNode"]:
         """
         Traverse the tree in depth-first pre-order.
+        Children are read after the node is yielded, so they can be modified in the meantime.
         """
-        yield self
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
 
-        for child in self.children:
-            yield from child.traverse_depth_first_pre_order()
+            # Reversed, so the first child is on the top of the stack.
+            stack.extend(reversed(node.children))
 
     def traverse_depth_first_post_order(self) -> Iterator["TreeNode"]:
         """
         Traverse the tree in depth-first post-order.
         """
-        for child in self.children:
-            yield from child.traverse_depth_first_post_order()
+        # Node is yielded when popped for the second time, after all its children.
+        stack = [(self, False)]
+        while stack:
+            node, children_visited = stack.pop()
+            if children_visited:
+                yield node
+                continue
 
-        yield self
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(node.children))
 
 
 class Tree:
@@ -308,7 +266,28 @@ class Tree:
         entries : list[Entry]
             List of Entry objects representing the crate structure.
         """
-        self.root = TreeNode(entries, Indexer(len(entries)))
+        if not entries:
+            raise RuntimeError("No entries to build the tree from")
+
+        self.root = TreeNode(entries[0])
+
+        # Nodes on the path from root to the last added node, with their nest levels.
+        stack = [(self.root, entries[0].nest_level)]
+        for entry in entries[1:]:
+            while stack and stack[-1][1] >= entry.nest_level:
+                stack.pop()
+
+            # Entry is not nested in root - tree is complete.
+            if not stack:
+                break
+
+            parent = stack[-1][0]
+            node = TreeNode(entry, parent)
+            parent.children.append(node)
+            stack.append((node, entry.nest_level))
+
+        # Built lazily on first lookup, dropped whenever the tree is modified.
+        self._nodes_by_unique_name: dict[str, TreeNode] | None = None
 
     def write(self, target: IO[str]) -> None:
         """
@@ -331,14 +310,9 @@ class Tree:
         visibility : Visibility
             The visibility level to filter nodes by.
         """
+        self._nodes_by_unique_name = None
         for node in self.root.traverse_depth_first_pre_order():
-            children_to_remove = []
-            for ndx, child in enumerate(node.children):
-                if child.visibility != visibility:
-                    children_to_remove.append(ndx)
-
-            for ndx in reversed(children_to_remove):
-                del node.children[ndx]
+            node.children = [child for child in node.children if child.visibility == visibility]
 
     def filter_item_type(self, item_type_flag: ItemTypeFlag) -> None:
         """
@@ -349,27 +323,18 @@ class Tree:
         item_type_flag : ItemTypeFlag
             The item type flag to filter nodes by.
         """
+        self._nodes_by_unique_name = None
+        # ItemTypeFlag can consist of multiple ItemType
+        allowed_item_types = frozenset(ItemType[flag.name] for flag in item_type_flag)
         for node in self.root.traverse_depth_first_post_order():
-            children_to_remove = []
-            # Check if any child has the matching item type
-            for ndx, child in enumerate(node.children):
-                any_flag_present = False
-
-                # ItemTypeFlag can consist of multiple ItemType
-                for flag in item_type_flag:
-                    item_type = ItemType[flag.name]
-                    if child.item_type == item_type:
-                        any_flag_present = True
-                        break
-
-                if any_flag_present or ("has_matching_type" in child.metadata):
-                    node.metadata.add("has_matching_type")
-                else:
-                    children_to_remove.append(ndx)
-
-            # Remove children that do not match the item type
-            for ndx in reversed(children_to_remove):
-                del node.children[ndx]
+            # Keep children with the matching item type or with matching descendants
+            children_to_keep = []
+            for child in node.children:
+                if child.item_type in allowed_item_types or child.has_matching_type:
+                    node.has_matching_type = True
+                    children_to_keep.append(child)
+
+            node.children = children_to_keep
 
     def _find_node_by_unique_name(self, unique_name: str) -> TreeNode:
         """
@@ -380,11 +345,16 @@ class Tree:
         unique_name : str
             The unique name of the node to find.
         """
-        for node in self.root.traverse_depth_first_pre_order():
-            if node.unique_name == unique_name:
-                return node
+        if self._nodes_by_unique_name is None:
+            self._nodes_by_unique_name = {}
+            for node in self.root.traverse_depth_first_pre_order():
+                # Keep first node in pre-order on name collision.
+                self._nodes_by_unique_name.setdefault(node.unique_name, node)
 
-        raise RuntimeError(f"Node with unique name '{unique_name}' not found")
+        node = self._nodes_by_unique_name.get(unique_name)
+        if node is None:
+            raise RuntimeError(f"Node with unique name '{unique_name}' not found")
+        return node
 
     def add_comments_from_reference(self, reference_tree: "Tree") -> None:
         """
@@ -403,31 +373,35 @@ class Tree:
                     "in the current tree.\n",
                 )
 
-    def count_leaf_nodes(self) -> int:
+    def count_leaves_and_matching(self, comment_prefix: str) -> tuple[int, int]:
         """
-        Count the number of leaf nodes in the tree.
+        Count leaf nodes in a single traversal.
         A leaf node is defined as a node with no children.
-        """
-        count = 0
-        for node in self.root.traverse_depth_first_pre_order():
-            if not node.children:
-                count += 1
-        return count
-
-    def count_leaf_nodes_with_comment(self, comment: str) -> int:
-        """
-        Count the number of leaf nodes that have a comment starting with the specified string.
+        Returns the number of all leaf nodes and the number of leaf nodes
+        that have a comment starting with the specified string.
 
         Parameters
         ----------
-        comment : str
-            The comment string to match against leaf nodes' comments.
+        comment_prefix : str
+            The string to match against the start of leaf nodes' comments.
         """
-        count = 0
+        all_count = 0
+        with_comment_count = 0
         for node in self.root.traverse_depth_first_pre_order():
-            if not node.children and node.line.has_comment() and node.line.comment.startswith(comment):
-                count += 1
-        return count
+            if node.children:
+                continue
+
+            all_count += 1
+            if node.line.has_comment() and node.line.comment.startswith(comment_prefix):
+                with_comment_count += 1
+        return all_count, with_comment_count
+
+
+# Item type following a tree branch, e.g. "├── fn name: pub".
+# Longest values are listed first, so "fn" never shadows "const fn".
+_ITEM_TYPE_REGEX = re.compile(
+    "─ (" + "|".join(re.escape(t.value) for t in sorted(ItemType, key=len, reverse=True)) + ") "
+)
 
 
 def process_line(line: str) -> Entry:
@@ -442,10 +416,9 @@ def process_line(line: str) -> Entry:
     if line.startswith("crate"):
         return Entry(line, ItemType.CRATE, 0)
 
-    for item_type in ItemType:
-        found = line.find(f"─ {item_type.value} ")
-        if found != -1:
-            return Entry(line, item_type, found)
+    match = _ITEM_TYPE_REGEX.search(line)
+    if match is not None:
+        return Entry(line, ItemType(match.group(1)), match.start())
 
     raise RuntimeError(f"No known item type found for parsed line: {line}")
 
@@ -459,18 +432,9 @@ def process_input(input_lines: list[str]) -> list[Entry]:
     input_lines : list[str]
         List of input lines to process.
     """
-    data = []
-
-    for line in input_lines:
-        # We cannot remove leading spaces, as they are part of the structure
-        line = line.rstrip()
-        if len(line) == 0:
-            continue
-
-        entry = process_line(line)
-        data.append(entry)
-
-    return data
+    # We cannot remove leading spaces, as they are part of the structure
+    stripped_lines = (line.rstrip() for line in input_lines)
+    return [process_line(line) for line in stripped_lines if line]
 
 
 def process_args() -> argparse.Namespace:
@@ -521,7 +485,7 @@ if __name__ == "__main__":
     args = process_args()
 
     with open(args.input) as f:
-        input_lines = f.readlines()
+        input_lines = f.read().splitlines()
 
     tree = Tree(process_input(input_lines))
     tree.filter_visibility(Visibility[args.visibility])
@@ -529,7 +493,7 @@ if __name__ == "__main__":
 
     if args.reference:
         with open(args.reference) as f:
-            reference_lines = f.readlines()
+            reference_lines = f.read().splitlines()
 
         ref_tree = Tree(process_input(reference_lines))
         tree.add_comments_from_reference(ref_tree)
@@ -540,9 +504,8 @@ if __name__ == "__main__":
     else:
         tree.write(sys.stdout)
 
-    all_nodes = tree.count_leaf_nodes()
+    all_nodes, covered_nodes = tree.count_leaves_and_matching("YES")
     if all_nodes == 0:
         raise RuntimeError("No leaf nodes found in the tree.")
 
-    covered_nodes = tree.count_leaf_nodes_with_comment("YES")
     print(f"Coverage rate: {covered_nodes}/{all_nodes} ({covered_nodes / all_nodes * 100:.2f}%)", file=sys.stderr)  # noqa: T201 Printing status to stderr
@@ -24,7 +24,7 @@ __all__ = [
 import logging
 
 from . import cap_utils
-from .build_tools import BazelTools, BuildTools, CargoTools
+from .build_tools import BazelTools, BuildTools, CargoTools, prefetch
 from .log_container import LogContainer
 from .result_entry import ResultEntry
 from .scenario import Scenario, ScenarioResult
@@ -14,17 +14,23 @@
 Utilities for interacting with build systems.
 """
 
-__all__ = ["BuildTools", "CargoTools", "BazelTools"]
+__all__ = ["BuildTools", "CargoTools", "BazelTools", "prefetch"]
 
-import json
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from subprocess import PIPE, Popen, TimeoutExpired
 from typing import Any
 
 import pytest
 
+# "orjson" is an optional, faster drop-in for parsing JSON.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 logger = logging.getLogger(__package__)
 # region common
 
@@ -162,6 +168,34 @@ class BuildTools(ABC):
             Additional parameters to pass to build command.
         """
 
+    def prefetch(self) -> None:
+        """
+        Run and cache project queries ahead of use.
+        CWD must be inside the project.
+        Nothing is done by default.
+        """
+        return
+
+
+def prefetch(tools: list[BuildTools]) -> None:
+    """
+    Run project queries of multiple build tools concurrently.
+    Results are cached by each instance, errors are rethrown.
+
+    Parameters
+    ----------
+    tools : list[BuildTools]
+        Build tools to prefetch.
+    """
+    if not tools:
+        return
+
+    # Queries are spawned subprocesses, threads only wait for them.
+    with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+        futures = [executor.submit(t.prefetch) for t in tools]
+    for future in futures:
+        future.result()
+
 
 # endregion
 
@@ -189,22 +223,73 @@ class CargoTools(BuildTools):
             "cargo build" timeout in seconds.
         """
         super().__init__(option_prefix, command_timeout, build_timeout)
+        # Cargo metadata cached per CWD, as CWD determines Cargo project.
+        # Stored along with fingerprint of workspace manifests.
+        self._metadata_cache: dict[Path, tuple[tuple[int, ...] | None, dict[str, Any]]] = {}
+
+    def _manifests_fingerprint(self, metadata: dict[str, Any]) -> tuple[int, ...] | None:
+        """
+        Get modification times of workspace manifests.
+        Returns None if any of manifests cannot be accessed.
+
+        Parameters
+        ----------
+        metadata : dict[str, Any]
+            Cargo metadata.
+        """
+        manifest_paths = [
+            Path(metadata["workspace_root"]) / "Cargo.toml",
+            *(Path(pkg["manifest_path"]) for pkg in metadata["packages"]),
+        ]
+        try:
+            return tuple(path.stat().st_mtime_ns for path in manifest_paths)
+        except OSError:
+            return None
+
+    def invalidate_metadata(self) -> None:
+        """
+        Drop cached Cargo metadata for all CWDs.
+        """
+        self._metadata_cache.clear()
 
     def metadata(self) -> dict[str, Any]:
         """
         Read Cargo metadata and return as dict.
         CWD must be inside Cargo project.
+        Result is cached per instance and CWD, same object is returned on subsequent calls.
+        Cache is invalidated when workspace manifests are modified, or using "invalidate_metadata".
         """
+        # Return cached metadata if available and manifests are unchanged.
+        cwd = Path.cwd()
+        if cwd in self._metadata_cache:
+            fingerprint, metadata = self._metadata_cache[cwd]
+            if fingerprint is not None and fingerprint == self._manifests_fingerprint(metadata):
+                logger.debug(f"Using cached Cargo metadata for {cwd}")
+                return metadata
+            logger.debug(f"Cargo manifests modified, dropping cached metadata for {cwd}")
+            del self._metadata_cache[cwd]
+
         # Run command.
-        command = ["cargo", "metadata", "--format-version", "1"]
+        # Dependencies are not required - only workspace members and target directory are used.
+        command = ["cargo", "metadata", "--format-version", "1", "--no-deps"]
         logger.debug(f"Running Cargo metadata command: `{self._command_str(command)}`")
-        with Popen(command, stdout=PIPE, text=True) as p:
+        # Output is kept as bytes - JSON parser handles UTF-8 decoding, no intermediate "str" copy is made.
+        with Popen(command, stdout=PIPE) as p:
             stdout, _ = p.communicate(timeout=self.command_timeout)
             if p.returncode != 0:
                 raise RuntimeError(f"Failed to read Cargo metadata, returncode: {p.returncode}")
 
         # Load stdout as JSON data.
-        return json.loads(stdout)
+        metadata = json_loads(stdout)
+        self._metadata_cache[cwd] = (self._manifests_fingerprint(metadata), metadata)
+        return metadata
+
+    def prefetch(self) -> None:
+        """
+        Read and cache Cargo metadata ahead of use.
+        CWD must be inside Cargo project.
+        """
+        _ = self.metadata()
 
     def find_target_path(self, target_name: str, *, expect_exists: bool = True) -> Path:
         """
@@ -227,7 +312,7 @@ class CargoTools(BuildTools):
 
         # Check expected file exists.
         target_path = target_directory / "debug" / target_name
-        if expect_exists and not target_path.exists():
+        if expect_exists and not target_path.is_file():
             raise RuntimeError(f"Executable not found: {target_path}")
 
         logger.debug(f"Found target path: {target_path}")
@@ -249,21 +334,27 @@ class CargoTools(BuildTools):
         # Read metadata.
         metadata = self.metadata()
 
-        # Read manifest path from metadata.
-        pkg_entries = list(filter(lambda x: x["name"] == target_name, metadata["packages"]))
-        if len(pkg_entries) < 1:
+        # Find package entry, name must be unique.
+        pkg_entry = None
+        for pkg in metadata["packages"]:
+            if pkg["name"] != target_name:
+                continue
+            if pkg_entry is not None:
+                raise RuntimeError(f"Multiple data found for {target_name}")
+            pkg_entry = pkg
+
+        if pkg_entry is None:
             raise RuntimeError(f"No data found for {target_name}")
-        if len(pkg_entries) > 1:
-            raise RuntimeError(f"Multiple data found for {target_name}")
-        pkg_entry = pkg_entries[0]
 
+        # Read manifest path from metadata.
         manifest_path = Path(pkg_entry["manifest_path"]).resolve()
 
         # Run build.
         command = ["cargo", "build", "--manifest-path", manifest_path, *build_parameters]
         logger.debug(f"Running Cargo build command: `{self._command_str(command)}`")
-        with Popen(command, text=True) as p:
-            _, _ = p.communicate(timeout=self.build_timeout)
+        # Output is not captured, waiting for process is sufficient.
+        with Popen(command) as p:
+            p.wait(timeout=self.build_timeout)
             if p.returncode != 0:
                 raise RuntimeError(f"Failed to run build, returncode: {p.returncode}")
 
@@ -308,6 +399,9 @@ class BazelTools(BuildTools):
         # Store 'config' as command parameter nested in a list.
         # This is required to avoid empty parts ('') of commands.
         self.config_param = [f"--config={config}"] if config else []
+        # Workspace root and target paths cached per CWD, as CWD determines Bazel workspace.
+        self._workspace_cache: dict[Path, Path] = {}
+        self._target_path_cache: dict[tuple[Path, tuple[str, ...], str], Path] = {}
 
     def query(self, query: str = "//...") -> list[str]:
         """
@@ -327,14 +421,44 @@ class BazelTools(BuildTools):
             if p.returncode != 0:
                 raise RuntimeError(f"Failed to query Bazel, returncode: {p.returncode}")
 
-        # Load stdout as list of strings.
-        return stdout.strip().split("\n")
+        # Load stdout as list of strings, one per line.
+        # Empty output means no targets.
+        return stdout.splitlines()
+
+    def _workspace_root(self) -> Path:
+        """
+        Find workspace root.
+        CWD must be inside Bazel project.
+        Result is cached per instance and CWD.
+        """
+        # Return cached workspace root if available.
+        cwd = Path.cwd()
+        if cwd in self._workspace_cache:
+            return self._workspace_cache[cwd]
+
+        ws_root_cmd = ["bazel", "info", "workspace"]
+        with Popen(ws_root_cmd, stdout=PIPE, text=True) as p:
+            ws_str, _ = p.communicate(timeout=self.command_timeout)
+            ws_str = ws_str.strip()
+            if p.returncode != 0:
+                raise RuntimeError(f"Failed to determine workspace root, returncode: {p.returncode}")
+
+        ws_path = Path(ws_str)
+        self._workspace_cache[cwd] = ws_path
+        return ws_path
+
+    def prefetch(self) -> None:
+        """
+        Find and cache workspace root ahead of use.
+        CWD must be inside Bazel project.
+        """
+        _ = self._workspace_root()
 
     def find_target_path(self, target_name: str, *, expect_exists: bool = True) -> Path:
         """
         Find path to executable.
-        Target directory is taken from Cargo metadata.
-        "debug" configuration is used.
+        Path is taken from Bazel cquery, relative to workspace root.
+        Result is cached per instance, CWD, config and target name.
 
         Parameters
         ----------
@@ -343,34 +467,34 @@ class BazelTools(BuildTools):
         expect_exists : bool
             Check that executable exists.
         """
-        # Find workspace root.
-        ws_root_cmd = ["bazel", "info", "workspace"]
-        with Popen(ws_root_cmd, stdout=PIPE, text=True) as p:
-            ws_str, _ = p.communicate(timeout=self.command_timeout)
-            ws_str = ws_str.strip()
-            if p.returncode != 0:
-                raise RuntimeError(f"Failed to determine workspace root, returncode: {p.returncode}")
-        ws_path = Path(ws_str)
-
-        # Find executable path relative to workspace root path.
-        command = [
-            "bazel",
-            "cquery",
-            "--output=starlark",
-            "--starlark:expr=target.files_to_run.executable.path",
-            *self.config_param,
-            target_name,
-        ]
-        logger.debug(f"Running Bazel cquery command: `{self._command_str(command)}`")
-        with Popen(command, stdout=PIPE, text=True) as p:
-            target_str, _ = p.communicate(timeout=self.command_timeout)
-            target_str = target_str.strip()
-            if p.returncode != 0:
-                raise RuntimeError(f"Failed to cquery Bazel, returncode: {p.returncode}")
+        # Executable path is not changed by build, it can be reused.
+        cache_key = (Path.cwd(), tuple(self.config_param), target_name)
+        target_path = self._target_path_cache.get(cache_key)
+        if target_path is None:
+            # Find workspace root.
+            ws_path = self._workspace_root()
+
+            # Find executable path relative to workspace root path.
+            command = [
+                "bazel",
+                "cquery",
+                "--output=starlark",
+                "--starlark:expr=target.files_to_run.executable.path",
+                *self.config_param,
+                target_name,
+            ]
+            logger.debug(f"Running Bazel cquery command: `{self._command_str(command)}`")
+            with Popen(command, stdout=PIPE, text=True) as p:
+                target_str, _ = p.communicate(timeout=self.command_timeout)
+                target_str = target_str.strip()
+                if p.returncode != 0:
+                    raise RuntimeError(f"Failed to cquery Bazel, returncode: {p.returncode}")
+
+            target_path = ws_path / target_str
+            self._target_path_cache[cache_key] = target_path
 
         # Check expected file exists.
-        target_path = ws_path / target_str
-        if expect_exists and not target_path.exists():
+        if expect_exists and not target_path.is_file():
             raise RuntimeError(f"Executable not found: {target_path}")
 
         logger.debug(f"Found target path: {target_path}")
@@ -390,8 +514,9 @@ class BazelTools(BuildTools):
         # Run build.
         command = ["bazel", "build", *self.config_param, target_name, *build_parameters]
         logger.debug(f"Running Bazel build command: `{self._command_str(command)}`")
-        with Popen(command, text=True) as p:
-            _, _ = p.communicate(timeout=self.build_timeout)
+        # Output is not captured, waiting for process is sufficient.
+        with Popen(command) as p:
+            p.wait(timeout=self.build_timeout)
             if p.returncode != 0:
                 raise RuntimeError(f"Failed to run build, returncode: {p.returncode}")
 
@@ -2,17 +2,41 @@
 Module for executable capabilities handling.
 """
 
-__all__ = ["get_caps", "set_caps"]
+__all__ = ["get_caps", "get_caps_many", "set_caps", "set_caps_many"]
 
 
 import logging
-import re
 from pathlib import Path
 from subprocess import DEVNULL, PIPE, Popen
 
 logger = logging.getLogger(__package__)
 
 
+def _parse_caps(entries: list[str]) -> dict[str, str]:
+    """
+    Parse capabilities entries of a single "getcap" result line.
+
+    Parameters
+    ----------
+    entries : list[str]
+        Capabilities entries, e.g., `["cap_chown=eip", "cap_sys_chroot,cap_sys_nice+ep"]`.
+    """
+    result = {}
+    for entry in entries:
+        # Permissions might be after '=' or '+', whichever comes first.
+        separator_indices = [i for i in (entry.find("="), entry.find("+")) if i != -1]
+        if not separator_indices:
+            raise RuntimeError(f"Invalid getcap entry: {entry}")
+        separator_index = min(separator_indices)
+        names, perms = entry[:separator_index], entry[separator_index + 1 :]
+
+        # Multiple cap names might have same permissions.
+        for name in names.split(","):
+            result[name] = perms
+
+    return result
+
+
 def get_caps(executable_path: Path | str) -> dict[str, str]:
     """
     Check capabilities of the executable.
@@ -37,19 +61,54 @@ def get_caps(executable_path: Path | str) -> dict[str, str]:
     # 'getcap' returns caps grouped by permissions:
     # `<EXECUTABLE_NAME> cap_chown=eip cap_sys_chroot,cap_sys_nice+ep`
     entries = lines[0].split(" ")[1:]
-    result = {}
-    for entry in entries:
-        # Permissions might be after '=' or '+'.
-        names, perms = re.split(r"\+|=", entry, maxsplit=1)
-
-        # Multiple cap names might have same permissions.
-        for name in names.split(","):
-            result[name] = perms
+    result = _parse_caps(entries)
 
     logger.debug(f"Capabilities for {executable_path}: {result}")
     return result
 
 
+def get_caps_many(executable_paths: list[Path | str]) -> dict[Path | str, dict[str, str]]:
+    """
+    Check capabilities of multiple executables using a single "getcap" call.
+    Returns a dictionary where the keys are the provided paths, and the values are capabilities.
+    Executables not reported by "getcap" have no capabilities.
+
+    Parameters
+    ----------
+    executable_paths : list[Path | str]
+        Resolved paths to executables.
+        "getcap" is unable to get caps from symlink.
+    """
+    # "getcap" reports paths in the same form as provided.
+    # Result is keyed by provided objects, e.g., `Path("/x")` and `"/x"` are separate keys.
+    paths_by_str: dict[str, list[Path | str]] = {}
+    for path in executable_paths:
+        paths_by_str.setdefault(str(path), []).append(path)
+    result: dict[Path | str, dict[str, str]] = {path: {} for path in executable_paths}
+    if not paths_by_str:
+        return result
+
+    # Run 'getcap' command.
+    command = ["getcap", "-v", *paths_by_str]
+    with Popen(command, stdout=PIPE, stderr=DEVNULL, text=True) as p:
+        stdout, _ = p.communicate()
+        if p.returncode != 0:
+            raise RuntimeError(f'"getcap" failed with returncode: {p.returncode}')
+
+    # Process lines, one per executable:
+    # `<EXECUTABLE_NAME> cap_chown=eip cap_sys_chroot,cap_sys_nice+ep`
+    for line in stdout.splitlines():
+        path_str, *entries = line.split(" ")
+        if path_str not in paths_by_str:
+            raise RuntimeError(f"Invalid getcap result: {line}")
+        caps = _parse_caps(entries)
+        for path in paths_by_str[path_str]:
+            result[path] = dict(caps)
+
+    logger.debug(f"Capabilities for {len(result)} executables: {result}")
+    return result
+
+
 def set_caps(executable_path: Path | str, caps: dict[str, str]) -> None:
     """
     Set capabilities of the executable.
@@ -63,18 +122,33 @@ def set_caps(executable_path: Path | str, caps: dict[str, str]) -> None:
     caps : dict[str, str]
         Capabilities to set.
     """
-    caps_list = []
-    for name, perms in caps.items():
-        caps_list.append(f"{name}+{perms}")
-    caps_str = " ".join(caps_list)
+    set_caps_many({executable_path: caps})
+
+
+def set_caps_many(caps_by_path: dict[Path | str, dict[str, str]]) -> None:
+    """
+    Set capabilities of multiple executables using a single "setcap" call.
+    Root permissions are required for this operation.
+
+    Parameters
+    ----------
+    caps_by_path : dict[Path | str, dict[str, str]]
+        Capabilities to set, per resolved path to executable.
+        "setcap" is unable to grant caps to symlink.
+    """
+    if not caps_by_path:
+        return
+
+    # 'setcap' accepts multiple `<CAPS> <EXECUTABLE_PATH>` pairs.
+    command = ["sudo", "setcap"]
+    for executable_path, caps in caps_by_path.items():
+        caps_list = []
+        for name, perms in caps.items():
+            caps_list.append(f"{name}+{perms}")
+        caps_str = " ".join(caps_list)
+        command.extend([caps_str, str(executable_path)])
 
     # Run 'setcap' command.
-    command = [
-        "sudo",
-        "setcap",
-        caps_str,
-        str(executable_path),
-    ]
     logger.debug(f"Setting capabilities: `{' '.join(command)}`")
     with Popen(command) as p:
         _, _ = p.communicate()
@@ -18,7 +18,9 @@ __all__ = ["LogContainer"]
 
 import logging
 import re
-from itertools import groupby
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from itertools import islice
 from operator import attrgetter
 from typing import Any
 
@@ -39,9 +41,54 @@ class _NotSet:
 _not_set = _NotSet()
 
 
+# Characters with special meaning in regex patterns.
+# Other characters (e.g., "#", "-", whitespace) are special only within these or with flags, which are not used.
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+@lru_cache(maxsize=256)
+def _search_function(pattern: str) -> Callable[[str], Any]:
+    """
+    Create function searching for a pattern in a string.
+    Pattern without metacharacters is matched using substring search, without regex engine.
+    Functions (and compiled patterns) are cached and shared between containers.
+
+    Parameters
+    ----------
+    pattern : str
+        Regex pattern to search for.
+    """
+    if _REGEX_METACHARACTERS.isdisjoint(pattern):
+
+        def search(value: str) -> bool:
+            return pattern in value
+
+        return search
+    return re.compile(pattern).search
+
+
+def _is_hashable(value: Any) -> bool:
+    """
+    Check value can be hashed.
+    Unlike "isinstance(value, Hashable)", containers with unhashable items are detected.
+
+    Parameters
+    ----------
+    value : Any
+        Value to check.
+    """
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
 class LogContainer:
     """
     A container for storing and querying logs.
+
+    Values of queried fields are cached per field, entries are not expected to be modified after being added.
     """
 
     def __init__(self, entries: list[ResultEntry] | None = None) -> None:
@@ -54,19 +101,32 @@ class LogContainer:
         entries : list[ResultEntry] | None
             List of ResultEntry objects.
         """
-        self._logs = list(entries or [])
-        self._index = 0
+        self._logs = list(entries) if entries is not None else []
+        self._columns: dict[str, list[Any]] = {}
+        self._groups: dict[str, dict[Any, list[ResultEntry]]] = {}
+        self._exact_indices: dict[str, tuple[dict[type, dict[Any, list[int]]], list[int]]] = {}
+
+    @classmethod
+    def _from_owned(cls, entries: list[ResultEntry]) -> "LogContainer":
+        """
+        Create log container taking ownership of the list, without copying it.
+        Must be used only with lists not referenced elsewhere.
 
-    def __iter__(self):
-        self._index = 0
-        return self
+        Parameters
+        ----------
+        entries : list[ResultEntry]
+            List of ResultEntry objects.
+        """
+        container = cls()
+        container._logs = entries
+        return container
 
-    def __next__(self):
-        if self._index < len(self._logs):
-            result = self._logs[self._index]
-            self._index += 1
-            return result
-        raise StopIteration
+    def __iter__(self) -> Iterator[ResultEntry]:
+        """
+        Iterate over logs.
+        Each call returns an independent iterator.
+        """
+        return iter(self._logs)
 
     def __len__(self):
         """
@@ -80,9 +140,52 @@ class LogContainer:
         """
         return self._logs[subscript]
 
-    def _logs_by_field_field_only(self, field: str, *, reverse: bool) -> list[ResultEntry]:
+    def _column(self, field: str) -> list[Any]:
         """
-        Filter logs using field only.
+        Get values of a field for all logs, in order of logs.
+        Logs without a field have "_not_set" value.
+        Column is created on first use and cached.
+
+        Parameters
+        ----------
+        field : str
+            Name of the field.
+        """
+        column = self._columns.get(field)
+        if column is None:
+            column = [getattr(log, field, _not_set) for log in self._logs]
+            self._columns[field] = column
+        return column
+
+    def _exact_index(self, field: str) -> tuple[dict[type, dict[Any, list[int]]], list[int]]:
+        """
+        Get positions of logs by value of a field, grouped by value type.
+        Positions of logs with unhashable values are returned separately.
+        Index is created on first use and cached.
+
+        Parameters
+        ----------
+        field : str
+            Name of the field.
+        """
+        index = self._exact_indices.get(field)
+        if index is None:
+            positions_by_type: dict[type, dict[Any, list[int]]] = {}
+            unhashable_positions: list[int] = []
+            for position, found_value in enumerate(self._column(field)):
+                if found_value is _not_set:
+                    continue
+                try:
+                    positions_by_type.setdefault(type(found_value), {}).setdefault(found_value, []).append(position)
+                except TypeError:
+                    unhashable_positions.append(position)
+            index = (positions_by_type, unhashable_positions)
+            self._exact_indices[field] = index
+        return index
+
+    def _iter_logs_by_field_field_only(self, field: str, *, reverse: bool) -> Iterator[ResultEntry]:
+        """
+        Lazily filter logs using field only.
 
         Parameters
         ----------
@@ -91,56 +194,112 @@ class LogContainer:
         reverse : bool
             Return logs not matched.
         """
-        logs = []
-        for log in self._logs:
-            found_value = getattr(log, field, _not_set)
-            if isinstance(found_value, _NotSet):
-                if reverse:
-                    logs.append(log)
-                continue
+        # Lookups are bound to locals once, not repeated per log.
+        not_set = _not_set
+        logs_and_values = zip(self._logs, self._column(field), strict=True)
 
-            if not reverse:
-                logs.append(log)
-        logger.debug(f"Filtered {len(logs)} logs by {'NOT' if reverse else ''}{field=}")
-        return logs
+        # Loops are specialized for "reverse".
+        if reverse:
+            return (log for log, found_value in logs_and_values if found_value is not_set)
+        return (log for log, found_value in logs_and_values if found_value is not not_set)
 
-    def _logs_by_field_regex_match(self, field: str, pattern: str, *, reverse: bool) -> list[ResultEntry]:
+    def _iter_logs_by_field_regex_match(self, field: str, pattern: str, *, reverse: bool) -> Iterator[ResultEntry]:
         """
-        Filter logs using regex matching.
+        Lazily filter logs using regex matching.
         Underlying field value is casted to str.
 
         Parameters
         ----------
         field : str
             Name of the field to match.
+        pattern : str
+            Regex pattern to match.
         reverse : bool
             Return logs not matched.
-        pattern : str | _NotSet
-            Regex pattern to match.
         """
-        if not isinstance(pattern, str):
-            raise TypeError("Pattern must be a string")
-
-        logs = []
-        regex = re.compile(pattern)
-        for log in self._logs:
-            found_value = getattr(log, field, _not_set)
-            # Field must be set.
-            if isinstance(found_value, _NotSet):
-                if reverse:
-                    logs.append(log)
-                continue
-
-            # Value casted to "str" must be matched.
-            found = regex.search(str(found_value)) is not None
-            if found ^ reverse:
-                logs.append(log)
-        logger.debug(f"Filtered {len(logs)} logs by {field=} with {'reversed' if reverse else ''}{pattern=}")
-        return logs
+        # Lookups are bound to locals once, not repeated per log.
+        search = _search_function(pattern)
+        not_set = _not_set
+        logs_and_values = zip(self._logs, self._column(field), strict=True)
+
+        # Loops are specialized for "reverse", most values are already "str" and are not casted.
+        if reverse:
+            return (
+                log
+                for log, found_value in logs_and_values
+                # Field is not set or value casted to "str" is not matched.
+                if found_value is not_set or not search(found_value if type(found_value) is str else str(found_value))
+            )
+        return (
+            log
+            for log, found_value in logs_and_values
+            # Field must be set and value casted to "str" must be matched.
+            if found_value is not not_set and search(found_value if type(found_value) is str else str(found_value))
+        )
+
+    def _iter_logs_by_field_exact_match(self, field: str, value: Any, *, reverse: bool) -> Iterator[ResultEntry]:
+        """
+        Lazily filter logs using exact matching.
 
-    def _logs_by_field_exact_match(self, field: str, value: Any, *, reverse: bool) -> list[ResultEntry]:
+        Parameters
+        ----------
+        field : str
+            Name of the field to match.
+        value : Any
+            Exact value to match.
+        reverse : bool
+            Return logs not matched.
+        """
+        # Lookups are bound to locals once, not repeated per log.
+        value_type = type(value)
+        not_set = _not_set
+
+        # Use index to find candidates for matching hashable values.
+        # Value types must be checked separately - e.g., "True" and "1" are same dict keys.
+        # Subclasses of value type are allowed, same as with "isinstance".
+        if not reverse and _is_hashable(value):
+            positions_by_type, unhashable_positions = self._exact_index(field)
+            positions = [
+                position
+                for found_type, positions_by_value in positions_by_type.items()
+                if issubclass(found_type, value_type)
+                for position in positions_by_value.get(value, ())
+            ]
+            positions.extend(unhashable_positions)
+            positions.sort()
+
+            # Candidates are verified, e.g., types with custom equality might be not matched.
+            logs = self._logs
+            column = self._column(field)
+            return (
+                logs[position]
+                for position in positions
+                if isinstance(column[position], value_type) and column[position] == value
+            )
+
+        logs_and_values = zip(self._logs, self._column(field), strict=True)
+
+        # Loops are specialized for "reverse".
+        if reverse:
+            return (
+                log
+                for log, found_value in logs_and_values
+                # Field is not set, type or value is not matched.
+                if found_value is not_set or not (isinstance(found_value, value_type) and found_value == value)
+            )
+        return (
+            log
+            for log, found_value in logs_and_values
+            # Field must be set, type and value must be matched.
+            if found_value is not not_set and isinstance(found_value, value_type) and found_value == value
+        )
+
+    def _iter_logs_by_field(
+        self, field: str, *, reverse: bool, pattern: str | _NotSet = _not_set, value: Any | _NotSet = _not_set
+    ) -> Iterator[ResultEntry]:
         """
-        Filter logs using exact matching.
+        Select filtration method and lazily filter logs.
+        Parameters are validated on call, before iteration.
 
         Parameters
         ----------
@@ -148,24 +307,27 @@ class LogContainer:
             Name of the field to match.
         reverse : bool
             Return logs not matched.
-        value : Any
+        pattern : str | _NotSet
+            Regex pattern to match.
+            Underlying field value is casted to str.
+            Mutually exclusive with "value".
+        value : Any | _NotSet
             Exact value to match.
+            Mutually exclusive with "pattern".
         """
-        logs = []
-        for log in self._logs:
-            found_value = getattr(log, field, _not_set)
-            # Field must be set.
-            if isinstance(found_value, _NotSet):
-                if reverse:
-                    logs.append(log)
-                continue
+        pattern_set = pattern is not _not_set
+        value_set = value is not _not_set
 
-            # Type and value must be matched.
-            found = isinstance(found_value, type(value)) and found_value == value
-            if found ^ reverse:
-                logs.append(log)
-        logger.debug(f"Filtered {len(logs)} logs by {field=} with {'reversed' if reverse else ''}{value=}")
-        return logs
+        if pattern_set and not value_set:
+            if not isinstance(pattern, str):
+                raise TypeError("Pattern must be a string")
+            return self._iter_logs_by_field_regex_match(field, pattern, reverse=reverse)
+        elif not pattern_set and value_set:
+            return self._iter_logs_by_field_exact_match(field, value, reverse=reverse)
+        elif not pattern_set and not value_set:
+            return self._iter_logs_by_field_field_only(field, reverse=reverse)
+        else:
+            raise RuntimeError("Pattern and value parameters are mutually exclusive")
 
     def _logs_by_field(
         self, field: str, *, reverse: bool, pattern: str | _NotSet = _not_set, value: Any | _NotSet = _not_set
@@ -187,21 +349,14 @@ class LogContainer:
             Exact value to match.
             Mutually exclusive with "pattern".
         """
-        pattern_set = not isinstance(pattern, _NotSet)
-        value_set = not isinstance(value, _NotSet)
-
-        if pattern_set and not value_set:
-            return self._logs_by_field_regex_match(field, pattern, reverse=reverse)
-        elif not pattern_set and value_set:
-            return self._logs_by_field_exact_match(field, value, reverse=reverse)
-        elif not pattern_set and not value_set:
-            return self._logs_by_field_field_only(field, reverse=reverse)
-        else:
-            raise RuntimeError("Pattern and value parameters are mutually exclusive")
+        logs = list(self._iter_logs_by_field(field, reverse=reverse, pattern=pattern, value=value))
+        logger.debug(f"Filtered {len(logs)} logs by {field=} with {'reversed ' if reverse else ''}{pattern=}, {value=}")
+        return logs
 
     def contains_log(self, field: str, *, pattern: str | _NotSet = _not_set, value: Any | _NotSet = _not_set) -> bool:
         """
         Check if the container contains logs matching the given field and pattern or value.
+        Stops on first match.
 
         Parameters
         ----------
@@ -215,7 +370,8 @@ class LogContainer:
             Exact value to match.
             Mutually exclusive with "pattern".
         """
-        return len(self._logs_by_field(field, reverse=False, pattern=pattern, value=value)) > 0
+        logs = self._iter_logs_by_field(field, reverse=False, pattern=pattern, value=value)
+        return next(logs, _not_set) is not _not_set
 
     def get_logs(
         self, field: str | _NotSet = _not_set, *, pattern: str | _NotSet = _not_set, value: Any | _NotSet = _not_set
@@ -240,12 +396,12 @@ class LogContainer:
             Mutually exclusive with "pattern".
         """
         # Return copy of all logs.
-        if isinstance(field, _NotSet):
-            if not isinstance(pattern, _NotSet) or not isinstance(value, _NotSet):
+        if field is _not_set:
+            if pattern is not _not_set or value is not _not_set:
                 raise RuntimeError("Matching by pattern or value without field is not supported")
-            return LogContainer(self._logs[:])
+            return LogContainer(self._logs)
 
-        return LogContainer(self._logs_by_field(field, reverse=False, pattern=pattern, value=value))
+        return LogContainer._from_owned(self._logs_by_field(field, reverse=False, pattern=pattern, value=value))
 
     def find_log(
         self, field: str, *, pattern: str | _NotSet = _not_set, value: Any | _NotSet = _not_set
@@ -267,7 +423,9 @@ class LogContainer:
             Exact value to match.
             Mutually exclusive with "pattern".
         """
-        findings = self._logs_by_field(field, reverse=False, pattern=pattern, value=value)
+        # Stop after second match, more are not required to detect ambiguity.
+        logs = self._iter_logs_by_field(field, reverse=False, pattern=pattern, value=value)
+        findings = list(islice(logs, 2))
         if len(findings) == 1:
             return findings[0]
         if len(findings) > 1:
@@ -275,6 +433,39 @@ class LogContainer:
 
         return None
 
+    def match_patterns(self, field: str, patterns: list[str]) -> dict[str, "LogContainer"]:
+        """
+        Get logs matching each of the given patterns, in a single pass over logs.
+        Returns a dictionary where the keys are the patterns,
+        and the values are LogContainer instances containing the matching logs.
+        Equivalent to calling `get_logs(field, pattern=pattern)` for each pattern.
+
+        Parameters
+        ----------
+        field : str
+            Name of the field to match.
+        patterns : list[str]
+            Regex patterns to match.
+            Underlying field value is casted to str.
+        """
+        if not all(isinstance(pattern, str) for pattern in patterns):
+            raise TypeError("Pattern must be a string")
+
+        # Each pattern is searched separately - value can match many patterns.
+        matches: dict[str, list[ResultEntry]] = {pattern: [] for pattern in patterns}
+        searches = [(_search_function(pattern), logs) for pattern, logs in matches.items()]
+        for log, found_value in zip(self._logs, self._column(field), strict=True):
+            # Field must be set.
+            if found_value is _not_set:
+                continue
+
+            # Value is casted to "str" once for all patterns.
+            value_str = str(found_value)
+            for search, logs in searches:
+                if search(value_str):
+                    logs.append(log)
+        return {pattern: LogContainer._from_owned(logs) for pattern, logs in matches.items()}
+
     def add_log(self, log: ResultEntry | list[ResultEntry]) -> None:
         """
         Add log to the container.
@@ -285,12 +476,20 @@ class LogContainer:
             Logs to be added.
         """
         if isinstance(log, ResultEntry):
-            self._logs.append(log)
+            new_logs = [log]
         elif isinstance(log, list) and all(isinstance(x, ResultEntry) for x in log):
-            self._logs.extend(log)
+            new_logs = log
         else:
             raise TypeError("log must be a ResultEntry or list[ResultEntry]")
 
+        self._logs.extend(new_logs)
+        # Keep cached columns aligned with logs.
+        for field, column in self._columns.items():
+            column.extend(getattr(x, field, _not_set) for x in new_logs)
+        # Cached groups and indices are rebuilt on next use.
+        self._groups.clear()
+        self._exact_indices.clear()
+
     def remove_logs(
         self, field: str, *, pattern: str | _NotSet = _not_set, value: Any | _NotSet = _not_set
     ) -> "LogContainer":
@@ -309,19 +508,29 @@ class LogContainer:
             Exact value to match.
             Mutually exclusive with "pattern".
         """
-        return LogContainer(self._logs_by_field(field, reverse=True, pattern=pattern, value=value))
+        return LogContainer._from_owned(self._logs_by_field(field, reverse=True, pattern=pattern, value=value))
 
     def group_by(self, attribute: str) -> dict[str, "LogContainer"]:
         """
         Group logs by the given attribute.
         Returns a dictionary where the keys are the unique values of the attribute,
         and the values are LogContainer instances containing the grouped logs.
+        Keys are ordered by first occurrence, logs keep their order within a group.
+        Grouping is cached until logs are added, new containers are returned on each call.
 
         Parameters
         ----------
         attribute : str
             Attribute to group logs.
         """
-        sorted_logs_by_attr = sorted(self._logs, key=attrgetter(attribute))
-        grouped = groupby(sorted_logs_by_attr, key=attrgetter(attribute))
-        return {key: LogContainer(list(group)) for key, group in grouped}
+        groups = self._groups.get(attribute)
+        if groups is None:
+            # Single pass bucketing, sorting is not required and values don't have to be orderable.
+            groups = {}
+            get_attribute = attrgetter(attribute)
+            for log in self._logs:
+                groups.setdefault(get_attribute(log), []).append(log)
+            self._groups[attribute] = groups
+
+        # Returned containers might be modified, cached groups are copied.
+        return {key: LogContainer(group) for key, group in groups.items()}
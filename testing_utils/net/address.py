@@ -23,6 +23,9 @@ from typing import Any
 type IPAddress = IPv4Address | IPv6Address
 logger = logging.getLogger(__package__)
 
+# Address families of IP address types, allows single lookup instead of type checks.
+_FAMILIES: dict[type, AddressFamily] = {IPv4Address: AF_INET, IPv6Address: AF_INET6}
+
 
 @dataclass
 class Address:
@@ -67,6 +70,11 @@ class Address:
         """
         Return current address family.
         """
+        family = _FAMILIES.get(type(self.ip))
+        if family is not None:
+            return family
+
+        # Subclasses of IP address types.
         if isinstance(self.ip, IPv4Address):
             return AF_INET
         elif isinstance(self.ip, IPv6Address):
@@ -75,9 +83,8 @@ class Address:
             raise RuntimeError("Unsupported address family")
 
     def __str__(self) -> str:
-        if self.family() == AF_INET:
+        family = self.family()
+        if family == AF_INET:
             return f"{self.ip}:{self.port}"
-        elif self.family() == AF_INET6:
-            return f"[{self.ip}]:{self.port}"
         else:
-            raise RuntimeError("Unsupported address family")
+            return f"[{self.ip}]:{self.port}"
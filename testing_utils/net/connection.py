@@ -12,7 +12,9 @@
 # *******************************************************************************
 import logging
 from socket import (
+    IPPROTO_TCP,
     SOCK_STREAM,
+    TCP_NODELAY,
     socket,
 )
 
@@ -21,7 +23,7 @@ from .address import Address
 logger = logging.getLogger(__package__)
 
 
-def create_connection(address: Address, timeout: float | None = 3.0) -> socket:
+def create_connection(address: Address, timeout: float | None = 3.0, *, no_delay: bool = False) -> socket:
     """
     Create a socket connected to the server.
 
@@ -31,9 +33,13 @@ def create_connection(address: Address, timeout: float | None = 3.0) -> socket:
         Address to connect to.
     timeout : float | None
         Connection timeout in seconds. 0 for non-blocking mode, None for blocking mode.
+    no_delay : bool
+        Disable Nagle's algorithm, small writes are sent immediately instead of being coalesced.
     """
     s = socket(address.family(), SOCK_STREAM)
     s.settimeout(timeout)
+    if no_delay:
+        s.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
     s.connect(address.to_raw())
-    logger.debug(f"Created connection to {address} with {timeout=}s")
+    logger.debug(f"Created connection to {address} with {timeout=}s, {no_delay=}")
     return s
@@ -18,10 +18,29 @@ __all__ = ["ResultEntry"]
 
 import logging
 import re
-from typing import Any
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 logger = logging.getLogger(__package__)
 
+_CAMEL_CASE_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+@lru_cache(maxsize=1024)
+def _camel_case_to_snake_case(name: str) -> str:
+    """
+    Convert name from camel case to snake case.
+    Field names repeat across entries, results are cached.
+    Results are interned, same as attribute names set using "setattr".
+
+    Parameters
+    ----------
+    name : str
+        Name to convert.
+    """
+    return sys.intern(_CAMEL_CASE_BOUNDARY.sub("_", name).lower())
+
 
 class ResultEntry:
     """
@@ -40,27 +59,24 @@ class ResultEntry:
         json_message : dict[str, Any]
             Message content.
         """
-        for key in json_message:
-            if key == "fields":
-                for inner_key in json_message[key]:
-                    self._add_attribute(inner_key, json_message[key][inner_key])
-            else:
-                self._add_attribute(key, json_message[key])
-
-    def _camel_case_to_snake_case(self, name: str) -> str:
-        return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
-
-    def _add_attribute(self, name: str, value: Any) -> None:
-        name = self._camel_case_to_snake_case(name)
-        if hasattr(self, name):
-            raise RuntimeError(f"Tries to add duplicated field {name} to the ResultEntry, test issue!")
-        setattr(self, name, value)
+        # Collect attributes first, then set them all at once.
+        # Fields must not be duplicated or shadow class attributes (e.g., methods).
+        cls = type(self)
+        attributes: dict[str, Any] = {}
+        for key, value in json_message.items():
+            items = value.items() if key == "fields" else [(key, value)]
+            for name, item_value in items:
+                name = _camel_case_to_snake_case(name)
+                if name in attributes or hasattr(cls, name):
+                    raise RuntimeError(f"Tries to add duplicated field {name} to the ResultEntry, test issue!")
+                attributes[name] = item_value
+        self.__dict__.update(attributes)
 
-    def __getattribute__(self, name: str) -> Any:
-        # NOTE: this function is passing base implementation on purpose.
-        # Pylance is not able to handle autocompletion of dynamically generated attributes.
-        return super().__getattribute__(name)
+    if TYPE_CHECKING:
+        # NOTE: declared only for type checkers, runtime attribute access is not overridden.
+        # Pylance is not able to handle dynamically generated attributes.
+        def __getattr__(self, name: str) -> Any: ...
 
     def __str__(self) -> str:
-        members = [f"{attr}={getattr(self, attr)}" for attr in vars(self)]
+        members = [f"{attr}={value}" for attr, value in vars(self).items()]
         return f"ResultEntry({', '.join(members)})"
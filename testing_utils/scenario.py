@@ -21,18 +21,29 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import timedelta
+from operator import itemgetter
 from pathlib import Path
 from subprocess import PIPE, Popen, TimeoutExpired
 from typing import Any
 
 import pytest
 
+# "orjson" is an optional, faster drop-in for parsing JSON.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from .build_tools import BuildTools
 from .log_container import LogContainer
 from .result_entry import ResultEntry
 
 logger = logging.getLogger(__package__)
 
+# Results of executed commands, shared between test classes with enabled results caching.
+# Kept until cleared with "Scenario.clear_results_cache".
+_results_cache: dict[tuple[tuple[str, ...], float, bool], "ScenarioResult"] = {}
+
 
 @dataclass
 class ScenarioResult:
@@ -46,13 +57,13 @@ class ScenarioResult:
     hang: bool
 
     def __repr__(self) -> str:
-        class_name = self.__class__.__name__
-        field_reprs: list[str] = []
-        for name, value in self.__dict__.items():
-            if isinstance(value, str):
-                value = f"{value[:47]}..."
-            field_reprs.append(f"{name}={repr(value)}")
-        return f"{class_name}({', '.join(field_reprs)})"
+        # Output streams are truncated.
+        stdout = f"{self.stdout[:47]}..."
+        stderr = f"{self.stderr[:47]}..." if isinstance(self.stderr, str) else self.stderr
+        return (
+            f"{self.__class__.__name__}(stdout={stdout!r}, stderr={stderr!r}, "
+            f"return_code={self.return_code!r}, hang={self.hang!r})"
+        )
 
 
 class Scenario(ABC):
@@ -102,6 +113,21 @@ class Scenario(ABC):
         """
         return False
 
+    def cache_results(self, *args, **kwargs) -> bool:
+        """
+        Reuse results of previous execution of the same command, instead of running it again.
+        Should be enabled only for deterministic test scenarios.
+        """
+        return False
+
+    @staticmethod
+    def clear_results_cache() -> None:
+        """
+        Remove cached results of all test scenarios.
+        """
+        logger.debug(f"Clearing {len(_results_cache)} cached results")
+        _results_cache.clear()
+
     @pytest.fixture(scope="class")
     def target_path(self, build_tools: BuildTools, request: pytest.FixtureRequest) -> Path:
         """
@@ -128,8 +154,8 @@ class Scenario(ABC):
         test_config : dict[str, Any]
             Test configuration.
         """
-        # Dump test configuration to string.
-        test_config_str = json.dumps(test_config)
+        # Dump test configuration to compact string, without whitespace after separators.
+        test_config_str = json.dumps(test_config, separators=(",", ":"))
         return [str(target_path), "--name", scenario_name, "--input", test_config_str]
 
     def _run_command(self, command: list[str], execution_timeout: float, *args, **kwargs) -> ScenarioResult:
@@ -158,6 +184,29 @@ class Scenario(ABC):
         logger.debug(f"Command finished with return code {p.returncode}")
         return ScenarioResult(stdout, stderr, p.returncode, hang)
 
+    def _get_results(self, command: list[str], execution_timeout: float, *args, **kwargs) -> ScenarioResult:
+        """
+        Execute test scenario executable, or reuse cached results if enabled.
+
+        Parameters
+        ----------
+        command : list[str]
+            Command to invoke.
+        execution_timeout : float
+            Test execution timeout in seconds.
+        """
+        if not self.cache_results():
+            return self._run_command(command, execution_timeout, args, kwargs)
+
+        key = (tuple(command), execution_timeout, self.capture_stderr())
+        result = _results_cache.get(key)
+        if result is None:
+            result = self._run_command(command, execution_timeout, args, kwargs)
+            _results_cache[key] = result
+        else:
+            logger.debug(f"Reusing cached results of command: `{' '.join(command)}`")
+        return result
+
     @pytest.fixture(scope="class")
     def results(
         self,
@@ -176,7 +225,7 @@ class Scenario(ABC):
         execution_timeout : float
             Test execution timeout in seconds.
         """
-        return self._run_command(command, execution_timeout, args, kwargs)
+        return self._get_results(command, execution_timeout, args, kwargs)
 
     @pytest.fixture(scope="class")
     def logs(self, results: ScenarioResult, *args, **kwargs) -> LogContainer:
@@ -188,19 +237,25 @@ class Scenario(ABC):
         results : ScenarioResult
             Scenario results fixture.
         """
-        # Split into lines.
-        text_lines = results.stdout.strip().split("\n")
+        # Parse JSON messages and timestamps in microseconds in a single pass.
+        # Stdout is split without creating stripped copy, empty and whitespace-only lines are filtered out below.
+        # Split is done on "\n" only, unlike "str.splitlines" which splits on e.g. "\u2028" allowed in JSON strings.
+        messages: list[dict[str, Any]] = []
+        for line in results.stdout.split("\n"):
+            # Filter out non-JSON messages.
+            if not (line.startswith("{") and line.endswith("}")):
+                continue
+            msg = json_loads(line)
+            msg["timestamp"] = int(msg["timestamp"])
+            messages.append(msg)
 
-        # Filter out non-JSON messages.
-        messages = filter(lambda m: m.startswith("{") and m.endswith("}"), text_lines)
-        messages = list(map(json.loads, messages))
+        # Sort messages into chronological order.
+        # Sorting is done on integers, faster to compare than timedelta.
+        messages.sort(key=itemgetter("timestamp"))
 
         # Convert timestamp from microseconds to timedelta.
         for msg in messages:
-            msg["timestamp"] = timedelta(microseconds=int(msg["timestamp"]))
-
-        # Sort messages into chronological order.
-        messages.sort(key=lambda m: m["timestamp"])
+            msg["timestamp"] = timedelta(microseconds=msg["timestamp"])
 
         # Convert messages to list of ResultEntry and create log container.
         result_entries = [ResultEntry(msg) for msg in messages]
@@ -0,0 +1,39 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+from collections.abc import Iterator
+from socket import IPPROTO_TCP, TCP_NODELAY, create_server, socket
+
+import pytest
+
+from testing_utils.net.address import Address
+from testing_utils.net.connection import create_connection
+
+
+@pytest.fixture
+def server() -> Iterator[socket]:
+    with create_server(("127.0.0.1", 0)) as s:
+        yield s
+
+
+def test_create_connection_ok(server: socket):
+    address = Address.from_raw(*server.getsockname())
+    with create_connection(address) as s:
+        assert s.getpeername() == server.getsockname()
+        assert s.gettimeout() == 3.0
+        assert not s.getsockopt(IPPROTO_TCP, TCP_NODELAY)
+
+
+def test_create_connection_no_delay(server: socket):
+    address = Address.from_raw(*server.getsockname())
+    with create_connection(address, no_delay=True) as s:
+        assert s.getsockopt(IPPROTO_TCP, TCP_NODELAY)
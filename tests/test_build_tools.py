@@ -25,7 +25,7 @@ from typing import Any
 
 import pytest
 
-from testing_utils import BazelTools, BuildTools, CargoTools
+from testing_utils import BazelTools, BuildTools, CargoTools, prefetch
 
 
 @pytest.fixture(scope="class")
@@ -267,6 +267,63 @@ class TestCargoTools(TestBuildTools):
                 with pytest.raises(TimeoutExpired):
                     _ = tools.metadata()
 
+        def test_cached(self, tmp_project: tuple[str, Path]) -> None:
+            _, path = tmp_project
+            with cwd(path):
+                tools = CargoTools()
+                metadata = tools.metadata()
+
+                # Second call must not spawn "cargo metadata" again.
+                tools.command_timeout = 0.00000001
+                assert tools.metadata() is metadata
+
+        def test_cached_per_cwd(self, tmp_project: tuple[str, Path]) -> None:
+            _, path = tmp_project
+            tools = CargoTools()
+            with cwd(path):
+                _ = tools.metadata()
+
+            invalid_project_path = "/tmp"
+            with cwd(invalid_project_path), pytest.raises(RuntimeError):
+                _ = tools.metadata()
+
+        def test_cache_invalidated_on_manifest_change(self, tmp_project: tuple[str, Path]) -> None:
+            _, path = tmp_project
+            with cwd(path):
+                tools = CargoTools()
+                metadata = tools.metadata()
+
+                # Modification time change of manifest must cause "cargo metadata" to run again.
+                manifest_path = path / "Cargo.toml"
+                mtime_ns = manifest_path.stat().st_mtime_ns + 1_000_000_000
+                os.utime(manifest_path, ns=(mtime_ns, mtime_ns))
+                assert tools.metadata() is not metadata
+
+        def test_prefetch(self, tmp_project: tuple[str, Path]) -> None:
+            _, path = tmp_project
+            with cwd(path):
+                tools = [CargoTools(), CargoTools()]
+                prefetch(tools)
+
+                # Metadata must be already cached.
+                for t in tools:
+                    t.command_timeout = 0.00000001
+                    _ = t.metadata()
+
+        def test_prefetch_error(self, tmp_project: tuple[str, Path]) -> None:
+            invalid_project_path = "/tmp"
+            with cwd(invalid_project_path), pytest.raises(RuntimeError):
+                prefetch([CargoTools()])
+
+        def test_invalidate_metadata(self, tmp_project: tuple[str, Path]) -> None:
+            _, path = tmp_project
+            with cwd(path):
+                tools = CargoTools()
+                metadata = tools.metadata()
+
+                tools.invalidate_metadata()
+                assert tools.metadata() is not metadata
+
     class TestSelectBinPath:
         def test_target_path_set_ok(self, built_tmp_project: tuple[str, Path]) -> None:
             target_name, path = built_tmp_project
@@ -490,4 +547,14 @@ class TestBazelTools(TestBuildTools):
             # Check executable exists.
             assert target_path.exists()
 
+    def test_find_target_path_cached(self, built_tmp_project: tuple[str, Path]) -> None:
+        target_name, path = built_tmp_project
+        with cwd(path):
+            tools = BazelTools()
+            target_path = tools.find_target_path(target_name)
+
+            # Second call must not spawn Bazel commands again.
+            tools.command_timeout = 0.00000001
+            assert tools.find_target_path(target_name) == target_path
+
     # TODO: add query tests.  # noqa: FIX002
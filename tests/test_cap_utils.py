@@ -0,0 +1,85 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Tests for "cap_utils" module.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from subprocess import run
+
+import pytest
+
+from testing_utils.cap_utils import _parse_caps, get_caps_many
+
+
+class TestParseCaps:
+    def test_equal_separator(self):
+        assert _parse_caps(["cap_chown=eip"]) == {"cap_chown": "eip"}
+
+    def test_plus_separator(self):
+        assert _parse_caps(["cap_chown+ep"]) == {"cap_chown": "ep"}
+
+    def test_first_separator_used(self):
+        assert _parse_caps(["cap_chown=e+p"]) == {"cap_chown": "e+p"}
+        assert _parse_caps(["cap_chown+e=p"]) == {"cap_chown": "e=p"}
+
+    def test_comma_separated_names(self):
+        assert _parse_caps(["cap_sys_chroot,cap_sys_nice+ep"]) == {"cap_sys_chroot": "ep", "cap_sys_nice": "ep"}
+
+    def test_multiple_entries(self):
+        assert _parse_caps(["cap_chown=eip", "cap_sys_chroot,cap_sys_nice+ep"]) == {
+            "cap_chown": "eip",
+            "cap_sys_chroot": "ep",
+            "cap_sys_nice": "ep",
+        }
+
+    def test_no_entries(self):
+        assert _parse_caps([]) == {}
+
+    def test_invalid_entry(self):
+        with pytest.raises(RuntimeError, match="Invalid getcap entry: cap_chown"):
+            _parse_caps(["cap_chown"])
+
+
+class TestGetCapsMany:
+    @pytest.fixture
+    def executable_path(self, tmp_path: Path) -> Path:
+        path = tmp_path / "executable"
+        path.touch(mode=0o755)
+        return path
+
+    def test_empty(self):
+        assert get_caps_many([]) == {}
+
+    def test_no_caps(self, executable_path: Path):
+        assert get_caps_many([executable_path]) == {executable_path: {}}
+
+    def test_keys_as_provided(self, executable_path: Path):
+        result = get_caps_many([executable_path, str(executable_path)])
+        assert result == {executable_path: {}, str(executable_path): {}}
+
+    def test_not_existing(self, tmp_path: Path):
+        path = tmp_path / "not_existing"
+        assert get_caps_many([path]) == {path: {}}
+
+    @pytest.mark.skipif(os.geteuid() != 0 or shutil.which("setcap") is None, reason="requires root and setcap")
+    def test_caps(self, executable_path: Path, tmp_path: Path):
+        other_path = tmp_path / "other"
+        other_path.touch(mode=0o755)
+        run(["setcap", "cap_chown=eip cap_sys_chroot,cap_sys_nice+ep", str(executable_path)], check=True)
+
+        result = get_caps_many([executable_path, str(executable_path), other_path])
+        expected = {"cap_chown": "eip", "cap_sys_chroot": "ep", "cap_sys_nice": "ep"}
+        assert result == {executable_path: expected, str(executable_path): expected, other_path: {}}
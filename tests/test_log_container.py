@@ -73,9 +73,9 @@ class TestInit:
         assert len(lc2) == 1
 
 
-class TestIterNext:
+class TestIter:
     """
-    Tests for `__iter__` and `__next__`.
+    Tests for `__iter__`.
     """
 
     def test_iterator_ok(self, lc_basic: LogContainer):
@@ -87,6 +87,10 @@ class TestIterNext:
         for _ in lc:
             raise RuntimeError("Statement shouldn't be reached")
 
+    def test_iterator_nested(self, lc_basic: LogContainer):
+        pairs = [(outer.index, inner.index) for outer in lc_basic for inner in lc_basic]
+        assert pairs == [(i, j) for i in range(10) for j in range(10)]
+
     def test_list_ok(self, lc_basic: LogContainer):
         logs = list(lc_basic)
         assert len(logs) == 10
@@ -161,6 +165,18 @@ class TestContainsLog:
         )
         assert not lc.contains_log("invalid")
 
+    def test_field_subclass_property_found(self):
+        class LevelEntry(ResultEntry):
+            @property
+            def is_debug(self) -> bool:
+                return self.level == "DEBUG"
+
+        lc = LogContainer([LevelEntry({"level": "DEBUG"}), LevelEntry({"level": "INFO"})])
+        assert lc.contains_log("is_debug")
+        assert list(lc.get_logs("is_debug", value=True)) == [lc[0]]
+        assert list(lc.get_logs("is_debug", pattern="False")) == [lc[1]]
+        assert len(lc.group_by("is_debug")) == 2
+
     def test_pattern_str_ok(self):
         lc = LogContainer()
         lc.add_log(
@@ -311,6 +327,23 @@ class TestContainsLog:
         )
         assert not lc.contains_log("some_id", value=10)
 
+    def test_pattern_stops_on_first_match(self):
+        class Value:
+            casts = 0
+
+            def __str__(self) -> str:
+                Value.casts += 1
+                return "match"
+
+        lc = LogContainer([ResultEntry({"value": Value()}) for _ in range(5)])
+        assert lc.contains_log("value", pattern="match")
+        assert Value.casts == 1
+
+    def test_pattern_invalid_type(self):
+        lc = LogContainer([ResultEntry({"level": "DEBUG"})])
+        with pytest.raises(TypeError):
+            _ = lc.contains_log("level", pattern=123)  # type: ignore
+
 
 class TestGetLogs:
     """
@@ -439,6 +472,47 @@ class TestGetLogs:
         assert logs[2].some_id == "10"
         assert logs[3].some_id == 100
 
+    def test_pattern_literal_ok(self):
+        lc = LogContainer()
+        lc.add_log(
+            [
+                ResultEntry({"fields": {"message": "Task started"}}),
+                ResultEntry({"fields": {"message": "Other message"}}),
+                ResultEntry({"fields": {"message": "Task finished"}}),
+            ]
+        )
+        logs = lc.get_logs("message", pattern="Task")
+        assert len(logs) == 2
+        assert logs[0].message == "Task started"
+        assert logs[1].message == "Task finished"
+
+    def test_pattern_literal_with_whitespace_ok(self):
+        lc = LogContainer()
+        lc.add_log(
+            [
+                ResultEntry({"fields": {"message": "Task #1 started"}}),
+                ResultEntry({"fields": {"message": "Task #1  started"}}),
+                ResultEntry({"fields": {"message": "Task #1 finished"}}),
+            ]
+        )
+        logs = lc.get_logs("message", pattern="Task #1 started")
+        assert len(logs) == 1
+        assert logs[0].message == "Task #1 started"
+
+    def test_pattern_metacharacters_not_literal(self):
+        lc = LogContainer()
+        lc.add_log(
+            [
+                ResultEntry({"fields": {"message": "a.b"}}),
+                ResultEntry({"fields": {"message": "axb"}}),
+                ResultEntry({"fields": {"message": "ab"}}),
+            ]
+        )
+        logs = lc.get_logs("message", pattern="a.b")
+        assert len(logs) == 2
+        assert logs[0].message == "a.b"
+        assert logs[1].message == "axb"
+
     def test_pattern_invalid_field(self):
         lc = LogContainer()
         lc.add_log(
@@ -527,6 +601,46 @@ class TestGetLogs:
         assert len(logs) == 1
         assert logs[0].some_id == 0
 
+    def test_value_filter_subclass_type(self):
+        lc = LogContainer()
+        lc.add_log(
+            [
+                ResultEntry({"someId": 1}),
+                ResultEntry({"someId": True}),
+                ResultEntry({"someId": 1.0}),
+                ResultEntry({"someId": "1"}),
+            ]
+        )
+        # "bool" is a subclass of "int".
+        assert [log.some_id for log in lc.get_logs("some_id", value=1)] == [1, True]
+        assert [log.some_id for log in lc.get_logs("some_id", value=True)] == [True]
+        assert [log.some_id for log in lc.get_logs("some_id", value=1.0)] == [1.0]
+
+    def test_value_unhashable(self):
+        lc = LogContainer()
+        lc.add_log(
+            [
+                ResultEntry({"someId": [1, 2]}),
+                ResultEntry({"someId": (1, 2)}),
+                ResultEntry({"someId": {"key": 1}}),
+                ResultEntry({"someId": ([1], 2)}),
+                ResultEntry({"someId": [1, 2]}),
+            ]
+        )
+        assert len(lc.get_logs("some_id", value=[1, 2])) == 2
+        assert len(lc.get_logs("some_id", value=(1, 2))) == 1
+        assert len(lc.get_logs("some_id", value={"key": 1})) == 1
+        assert len(lc.get_logs("some_id", value=([1], 2))) == 1
+
+    def test_value_after_add_log(self):
+        lc = LogContainer([ResultEntry({"level": "INFO"}), ResultEntry({"level": "DEBUG"})])
+        assert len(lc.get_logs("level", value="INFO")) == 1
+
+        lc.add_log([ResultEntry({"flag": True}), ResultEntry({"level": "INFO"})])
+        logs = lc.get_logs("level", value="INFO")
+        assert len(logs) == 2
+        assert logs[1] is lc[3]
+
     def test_value_invalid_field(self):
         lc = LogContainer()
         lc.add_log(
@@ -628,6 +742,19 @@ class TestFindLog:
         with pytest.raises(ValueError):  # noqa: PT011
             _ = lc.find_log("level", pattern=r"WARN|INFO")
 
+    def test_pattern_many_found_stops_on_second_match(self):
+        class Value:
+            casts = 0
+
+            def __str__(self) -> str:
+                Value.casts += 1
+                return "match"
+
+        lc = LogContainer([ResultEntry({"value": Value()}) for _ in range(5)])
+        with pytest.raises(ValueError):  # noqa: PT011
+            _ = lc.find_log("value", pattern="match")
+        assert Value.casts == 2
+
     def test_pattern_cast_type(self):
         lc = LogContainer()
         lc.add_log(
@@ -832,6 +959,16 @@ class TestAddLog:
         assert len(logs2) == 3
         assert len(lc) == 5
 
+    def test_after_query_ok(self):
+        lc = LogContainer([ResultEntry({"level": "DEBUG"}), ResultEntry({"flag": False})])
+        assert len(lc.get_logs("level", value="INFO")) == 0
+
+        lc.add_log(ResultEntry({"level": "INFO"}))
+        lc.add_log([ResultEntry({"flag": True}), ResultEntry({"level": "INFO"})])
+        assert len(lc._column("level")) == 5  # noqa: SLF001
+        assert len(lc.get_logs("level", value="INFO")) == 2
+        assert len(lc.remove_logs("level")) == 2
+
     @pytest.mark.parametrize("value", ["raw_string", None, 123, False])
     def test_invalid_type(self, value: Any):
         lc = LogContainer()
@@ -1111,3 +1248,110 @@ class TestGroupBy:
         assert groups["ThreadId(1)"][0].message == "Info message 2"
         assert groups["ThreadId(2)"][0].message == "Info message 1"
         assert groups["ThreadId(2)"][1].message == "Info message 3"
+
+    def test_first_occurrence_order(self):
+        lc = LogContainer()
+        lc.add_log(
+            [
+                ResultEntry({"threadId": "ThreadId(2)", "index": 0}),
+                ResultEntry({"threadId": "ThreadId(1)", "index": 1}),
+                ResultEntry({"threadId": "ThreadId(2)", "index": 2}),
+                ResultEntry({"threadId": "ThreadId(3)", "index": 3}),
+            ]
+        )
+        groups = lc.group_by("thread_id")
+        assert list(groups) == ["ThreadId(2)", "ThreadId(1)", "ThreadId(3)"]
+        assert [log.index for log in groups["ThreadId(2)"]] == [0, 2]
+
+    def test_unorderable_values(self):
+        lc = LogContainer()
+        lc.add_log(
+            [
+                ResultEntry({"someId": 1}),
+                ResultEntry({"someId": None}),
+                ResultEntry({"someId": "1"}),
+                ResultEntry({"someId": 1}),
+            ]
+        )
+        groups = lc.group_by("some_id")
+        assert len(groups) == 3
+        assert len(groups[1]) == 2
+        assert len(groups[None]) == 1
+        assert len(groups["1"]) == 1
+
+    def test_missing_attribute(self):
+        lc = LogContainer()
+        lc.add_log([ResultEntry({"someId": 1}), ResultEntry({"level": "INFO"})])
+        with pytest.raises(AttributeError):
+            _ = lc.group_by("some_id")
+
+    def test_cached_groups_not_modified(self):
+        lc = LogContainer([ResultEntry({"level": "INFO"}), ResultEntry({"level": "DEBUG"})])
+        groups = lc.group_by("level")
+        groups["INFO"].add_log(ResultEntry({"level": "INFO"}))
+
+        # Containers returned by previous call must not affect next call.
+        groups = lc.group_by("level")
+        assert len(groups["INFO"]) == 1
+        assert len(groups["DEBUG"]) == 1
+
+    def test_cache_invalidated_on_add_log(self):
+        lc = LogContainer([ResultEntry({"level": "INFO"})])
+        assert list(lc.group_by("level")) == ["INFO"]
+
+        lc.add_log(ResultEntry({"level": "DEBUG"}))
+        groups = lc.group_by("level")
+        assert list(groups) == ["INFO", "DEBUG"]
+        assert len(groups["DEBUG"]) == 1
+
+
+class TestMatchPatterns:
+    """
+    Tests for `match_patterns`.
+    """
+
+    def _common_lc(self) -> LogContainer:
+        return LogContainer(
+            [
+                ResultEntry({"level": "DEBUG", "someId": 1}),
+                ResultEntry({"level": "INFO", "someId": 11}),
+                ResultEntry({"level": "WARN"}),
+                ResultEntry({"someId": 2}),
+            ]
+        )
+
+    def test_ok(self):
+        lc = self._common_lc()
+        matches = lc.match_patterns("level", ["DEBUG", r"INFO|WARN", "ERROR"])
+        assert list(matches) == ["DEBUG", r"INFO|WARN", "ERROR"]
+        assert [log.level for log in matches["DEBUG"]] == ["DEBUG"]
+        assert [log.level for log in matches[r"INFO|WARN"]] == ["INFO", "WARN"]
+        assert len(matches["ERROR"]) == 0
+
+    def test_overlapping_patterns(self):
+        lc = self._common_lc()
+        matches = lc.match_patterns("some_id", [r"^1$", "1", r"\d"])
+        assert [log.some_id for log in matches[r"^1$"]] == [1]
+        assert [log.some_id for log in matches["1"]] == [1, 11]
+        assert [log.some_id for log in matches[r"\d"]] == [1, 11, 2]
+
+    def test_same_as_get_logs(self):
+        lc = self._common_lc()
+        patterns = ["E", r"^[DI]", "invalid"]
+        matches = lc.match_patterns("level", patterns)
+        for pattern in patterns:
+            assert list(matches[pattern]) == list(lc.get_logs("level", pattern=pattern))
+
+    def test_invalid_field(self):
+        lc = self._common_lc()
+        matches = lc.match_patterns("invalid", ["DEBUG"])
+        assert len(matches["DEBUG"]) == 0
+
+    def test_no_patterns(self):
+        lc = self._common_lc()
+        assert lc.match_patterns("level", []) == {}
+
+    def test_invalid_pattern_type(self):
+        lc = self._common_lc()
+        with pytest.raises(TypeError):
+            _ = lc.match_patterns("level", ["DEBUG", 1])  # type: ignore
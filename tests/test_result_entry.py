@@ -82,3 +82,23 @@ def test_result_entry_access_invalid_attribute():
     )
     with pytest.raises(AttributeError):
         _ = entry.invalid_attribute
+
+
+def test_result_entry_duplicated_field():
+    with pytest.raises(RuntimeError):
+        ResultEntry({"threadId": 1, "fields": {"thread_id": 2}})
+
+
+def test_result_entry_class_attribute_field():
+    with pytest.raises(RuntimeError):
+        ResultEntry({"fields": {"__str__": "value"}})
+
+
+def test_result_entry_subclass_property_field():
+    class LevelEntry(ResultEntry):
+        @property
+        def is_debug(self) -> bool:
+            return self.level == "DEBUG"
+
+    with pytest.raises(RuntimeError):
+        LevelEntry({"level": "DEBUG", "isDebug": True})
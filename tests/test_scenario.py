@@ -0,0 +1,112 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Tests for "scenario" module.
+"""
+
+import sys
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+
+from testing_utils import BuildTools, CargoTools, Scenario
+from testing_utils.scenario import _results_cache
+
+
+class ExampleScenario(Scenario):
+    """
+    Scenario with all abstract fixtures implemented, executed directly using "_get_results".
+    """
+
+    def __init__(self, *, cache_results: bool = False, capture_stderr: bool = False) -> None:
+        self._cache_results = cache_results
+        self._capture_stderr = capture_stderr
+
+    @pytest.fixture(scope="class")
+    def build_tools(self) -> BuildTools:
+        return CargoTools()
+
+    @pytest.fixture(scope="class")
+    def scenario_name(self) -> str:
+        return "example"
+
+    @pytest.fixture(scope="class")
+    def test_config(self) -> dict[str, Any]:
+        return {}
+
+    def capture_stderr(self, *args, **kwargs) -> bool:
+        return self._capture_stderr
+
+    def cache_results(self, *args, **kwargs) -> bool:
+        return self._cache_results
+
+
+# Each execution prints a unique value.
+UNIQUE_COMMAND = [sys.executable, "-c", "import time; print(time.time_ns())"]
+
+
+@pytest.fixture(autouse=True)
+def clear_results_cache() -> Generator[None, None, None]:
+    Scenario.clear_results_cache()
+    yield
+    Scenario.clear_results_cache()
+
+
+class TestResultsCache:
+    def test_disabled_by_default(self):
+        assert not Scenario.cache_results(ExampleScenario())
+
+        scenario = ExampleScenario()
+        first = scenario._get_results(UNIQUE_COMMAND, 5.0)  # noqa: SLF001
+        second = scenario._get_results(UNIQUE_COMMAND, 5.0)  # noqa: SLF001
+        assert first.stdout != second.stdout
+        assert not _results_cache
+
+    def test_hit(self):
+        first = ExampleScenario(cache_results=True)._get_results(UNIQUE_COMMAND, 5.0)  # noqa: SLF001
+        second = ExampleScenario(cache_results=True)._get_results(UNIQUE_COMMAND, 5.0)  # noqa: SLF001
+        assert first is second
+        assert len(_results_cache) == 1
+
+    def test_key_command(self):
+        other_command = [*UNIQUE_COMMAND, "other"]
+        scenario = ExampleScenario(cache_results=True)
+        first = scenario._get_results(UNIQUE_COMMAND, 5.0)  # noqa: SLF001
+        second = scenario._get_results(other_command, 5.0)  # noqa: SLF001
+        assert first.stdout != second.stdout
+        assert len(_results_cache) == 2
+
+    def test_key_execution_timeout(self):
+        scenario = ExampleScenario(cache_results=True)
+        first = scenario._get_results(UNIQUE_COMMAND, 5.0)  # noqa: SLF001
+        second = scenario._get_results(UNIQUE_COMMAND, 6.0)  # noqa: SLF001
+        assert first.stdout != second.stdout
+        assert len(_results_cache) == 2
+
+    def test_key_capture_stderr(self):
+        first = ExampleScenario(cache_results=True)._get_results(UNIQUE_COMMAND, 5.0)  # noqa: SLF001
+        second = ExampleScenario(cache_results=True, capture_stderr=True)._get_results(UNIQUE_COMMAND, 5.0)  # noqa: SLF001
+        assert first.stdout != second.stdout
+        assert first.stderr is None
+        assert second.stderr == ""
+        assert len(_results_cache) == 2
+
+    def test_clear(self):
+        scenario = ExampleScenario(cache_results=True)
+        first = scenario._get_results(UNIQUE_COMMAND, 5.0)  # noqa: SLF001
+        Scenario.clear_results_cache()
+        assert not _results_cache
+
+        second = scenario._get_results(UNIQUE_COMMAND, 5.0)  # noqa: SLF001
+        assert first.stdout != second.stdout